@@ -64,13 +64,13 @@ def record_trade_on_blockchain(
     quantity_wei = w3.to_wei(quantity, "ether")
     price_wei = w3.to_wei(price, "ether")
     contract = w3.eth.contract(address=MOCK_CONTRACT_ADDRESS, abi=MOCK_ABI)
-    try:
-        sender_account = w3.eth.accounts[0]
-    except IndexError:
+    accounts = w3.eth.accounts
+    if not accounts:
         logger.info(
             "Error: No accounts found. Ensure your local node (e.g., Ganache) is running."
         )
         return
+    sender_account = accounts[0]
     logger.info(f"\nRecording transaction from {sender_account}...")
     contract.functions.recordTransaction(
         user_address, tx_type, ticker, quantity_wei, price_wei, notes
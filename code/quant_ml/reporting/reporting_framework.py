@@ -14,22 +14,32 @@ import datetime
 import json
 import logging
 import os
+import threading
 import uuid
 import warnings
 from io import BytesIO
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import jinja2
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+if TYPE_CHECKING:
+    import jinja2
+
 # FIX: import markdown at module level with a graceful fallback
 try:
     import markdown as _markdown_module
 
+    # markdown.markdown() builds a new Markdown instance, with all of its
+    # compiled patterns, on every call. Keep one converter per thread and
+    # reset it between documents instead.
+    _md_local = threading.local()
+
     def _md_to_html(text: str) -> str:
-        return _markdown_module.markdown(text)
+        converter = getattr(_md_local, "converter", None)
+        if converter is None:
+            converter = _md_local.converter = _markdown_module.Markdown()
+        return converter.reset().convert(text)
 
 except ImportError:
     _markdown_module = None
@@ -45,6 +55,62 @@ logger = logging.getLogger("reporting_framework")
 warnings.filterwarnings("ignore")
 
 
+# Default HTML report template (kept left-justified so output is not indented)
+_HTML_TEMPLATE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }}</title>
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; color: #333;
+               max-width: 1200px; margin: 0 auto; padding: 20px; }
+        h1, h2, h3 { color: #2c3e50; }
+        .header { border-bottom: 1px solid #eee; padding-bottom: 10px; margin-bottom: 20px; }
+        .section { margin-bottom: 30px; }
+        .section-title { border-bottom: 1px solid #eee; padding-bottom: 5px; }
+        table { border-collapse: collapse; width: 100%; margin-bottom: 20px; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        .chart { max-width: 100%; height: auto; }
+        .footer { border-top: 1px solid #eee; padding-top: 10px; margin-top: 30px;
+                  font-size: 0.8em; color: #777; }
+        pre { background-color: #f5f5f5; padding: 10px; border-radius: 5px; overflow-x: auto; }
+        code { font-family: Consolas, Monaco, 'Andale Mono', monospace; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{{ title }}</h1>
+        <p>{{ description }}</p>
+        <p><strong>Date:</strong> {{ date }}</p>
+        {% if author %}<p><strong>Author:</strong> {{ author }}</p>{% endif %}
+    </div>
+
+    {% for section in sections %}
+    <div class="section">
+        <h2 class="section-title">{{ section.title }}</h2>
+        {% if section.type == 'text' %}
+            {{ section.content|safe }}
+        {% elif section.type == 'chart' %}
+            <img class="chart" src="data:image/png;base64,{{ section.content }}" alt="{{ section.title }}">
+        {% elif section.type == 'table' %}
+            {{ section.content|safe }}
+        {% elif section.type == 'code' %}
+            <pre><code>{{ section.content }}</code></pre>
+        {% endif %}
+    </div>
+    {% endfor %}
+
+    <div class="footer">
+        <p>Generated on {{ generated_at }} | Version {{ version }}</p>
+    </div>
+</body>
+</html>
+"""
+
+
 class ReportTemplate:
     """Report template for risk reports."""
 
@@ -236,10 +302,35 @@ class ReportGenerator:
             template: Report template
         """
         self.template = template
-        self.jinja_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(os.path.dirname(os.path.abspath(__file__))),
-            autoescape=jinja2.select_autoescape(["html", "xml"]),
-        )
+        # jinja2 and matplotlib are imported on first use so that importing
+        # this module (e.g. for ReportTemplate alone) stays cheap.
+        self._jinja_env = None
+        # Chart figure is created on first use and reused for every chart
+        self._chart_figure = None
+        self._chart_canvas = None
+        self._chart_default_dpi = None
+
+    @property
+    def jinja_env(self) -> "jinja2.Environment":
+        """Jinja environment used for rendering, created on first access."""
+        if self._jinja_env is None:
+            import jinja2
+
+            # trim/lstrip blocks drop the whitespace left behind by block tags;
+            # inline template strings keep the previous (unescaped) behaviour.
+            self._jinja_env = jinja2.Environment(
+                loader=jinja2.FileSystemLoader(
+                    os.path.dirname(os.path.abspath(__file__))
+                ),
+                autoescape=jinja2.select_autoescape(
+                    ["html", "xml"], default_for_string=False
+                ),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                keep_trailing_newline=False,
+                auto_reload=False,
+            )
+        return self._jinja_env
 
     # FIX: added _get_html_template as the canonical name called by generate_html
     def _get_html_template(self) -> str:
@@ -262,10 +353,20 @@ class ReportGenerator:
         try:
             template_str = self._get_html_template()
             context = self._prepare_context(data)
-            html = self._render_html(template_str, context)
+            template = self.jinja_env.from_string(template_str)
             os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-            with open(output_path, "w") as f:
-                f.write(html)
+            # Stream rendered chunks into a sibling temp file and swap it in
+            # once complete, so a failed render leaves any existing report
+            # untouched.
+            tmp_path = f"{output_path}.{uuid.uuid4().hex[:8]}.tmp"
+            try:
+                with open(tmp_path, "x") as f:
+                    template.stream(**context).dump(f)
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
             return True
         except Exception as e:
             logger.error(f"Error generating HTML report: {e}")
@@ -307,60 +408,7 @@ class ReportGenerator:
 
     def _create_html_template(self) -> str:
         """Create and return the HTML template string."""
-        template = """
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>{{ title }}</title>
-            <style>
-                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333;
-                       max-width: 1200px; margin: 0 auto; padding: 20px; }
-                h1, h2, h3 { color: #2c3e50; }
-                .header { border-bottom: 1px solid #eee; padding-bottom: 10px; margin-bottom: 20px; }
-                .section { margin-bottom: 30px; }
-                .section-title { border-bottom: 1px solid #eee; padding-bottom: 5px; }
-                table { border-collapse: collapse; width: 100%; margin-bottom: 20px; }
-                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-                th { background-color: #f2f2f2; }
-                .chart { max-width: 100%; height: auto; }
-                .footer { border-top: 1px solid #eee; padding-top: 10px; margin-top: 30px;
-                          font-size: 0.8em; color: #777; }
-                pre { background-color: #f5f5f5; padding: 10px; border-radius: 5px; overflow-x: auto; }
-                code { font-family: Consolas, Monaco, 'Andale Mono', monospace; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>{{ title }}</h1>
-                <p>{{ description }}</p>
-                <p><strong>Date:</strong> {{ date }}</p>
-                {% if author %}<p><strong>Author:</strong> {{ author }}</p>{% endif %}
-            </div>
-
-            {% for section in sections %}
-            <div class="section">
-                <h2 class="section-title">{{ section.title }}</h2>
-                {% if section.type == 'text' %}
-                    {{ section.content|safe }}
-                {% elif section.type == 'chart' %}
-                    <img class="chart" src="data:image/png;base64,{{ section.content }}" alt="{{ section.title }}">
-                {% elif section.type == 'table' %}
-                    {{ section.content|safe }}
-                {% elif section.type == 'code' %}
-                    <pre><code>{{ section.content }}</code></pre>
-                {% endif %}
-            </div>
-            {% endfor %}
-
-            <div class="footer">
-                <p>Generated on {{ generated_at }} | Version {{ version }}</p>
-            </div>
-        </body>
-        </html>
-        """
-        return template
+        return _HTML_TEMPLATE
 
     def _prepare_context(self, data: "np.ndarray | pd.DataFrame | list" = None) -> dict:
         """
@@ -433,7 +481,7 @@ class ReportGenerator:
             html: Rendered HTML
         """
         # FIX: docstring moved to top of method (was unreachable after try/except)
-        template = jinja2.Template(template_str)
+        template = self.jinja_env.from_string(template_str)
         html = template.render(**context)
         return html
 
@@ -449,13 +497,13 @@ class ReportGenerator:
         Args:
             chart_type: Type of chart ('line', 'bar', 'scatter', 'pie', 'heatmap')
             data: Chart data
-            options: Chart options
+            options: Chart options (title, xlabel, ylabel, grid, legend, dpi)
 
         Returns:
             image_base64: Base64 encoded image
         """
         options = options or {}
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._get_chart_axes(dpi=options.get("dpi"))
         if chart_type == "line":
             if isinstance(data, pd.DataFrame):
                 data.plot(ax=ax)
@@ -515,7 +563,7 @@ class ReportGenerator:
         elif chart_type == "heatmap":
             if isinstance(data, pd.DataFrame):
                 im = ax.imshow(data)
-                plt.colorbar(im, ax=ax)
+                fig.colorbar(im, ax=ax)
             else:
                 ax.text(
                     0.5,
@@ -547,11 +595,36 @@ class ReportGenerator:
             ax.legend()
 
         buffer = BytesIO()
-        plt.tight_layout()
-        fig.savefig(buffer, format="png")
-        plt.close(fig)
-        buffer.seek(0)
-        return base64.b64encode(buffer.read()).decode("utf-8")
+        fig.tight_layout()
+        self._chart_canvas.print_png(buffer)
+        return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+    def _get_chart_axes(self, dpi: Optional[float] = None) -> tuple:
+        """
+        Return a cleared (figure, axes) pair for chart rendering.
+
+        The figure is drawn with the Agg canvas directly rather than through
+        pyplot, and is reused across charts to avoid a figure allocation per
+        chart.
+
+        Args:
+            dpi: Resolution for this chart; None uses the figure default
+
+        Returns:
+            (fig, ax): Reusable figure and a fresh axes on it
+        """
+        if self._chart_figure is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            self._chart_figure = Figure(figsize=(10, 6))
+            self._chart_canvas = FigureCanvasAgg(self._chart_figure)
+            self._chart_default_dpi = self._chart_figure.get_dpi()
+        # clear() rather than ax.clear() so heatmap colorbars do not accumulate
+        self._chart_figure.clear()
+        # The figure is shared, so reset the resolution for every chart
+        self._chart_figure.set_dpi(dpi or self._chart_default_dpi)
+        return self._chart_figure, self._chart_figure.add_subplot(111)
 
     def _generate_table(
         self, data: "np.ndarray | pd.DataFrame | list", options: dict = None
@@ -653,10 +726,9 @@ class ReportScheduler:
 
     def remove_schedule(self, schedule_id: object) -> bool:
         """Remove report schedule by ID."""
-        if schedule_id in self.schedules:
-            del self.schedules[schedule_id]
-            return self._save_schedules()
-        return False
+        if self.schedules.pop(schedule_id, None) is None:
+            return False
+        return self._save_schedules()
 
     def list_schedules(self) -> list:
         """List all schedules."""
@@ -680,18 +752,20 @@ class ReportScheduler:
             if next_run <= now:
                 result = self.run_report(sid)
                 results[sid] = result
-                self.schedules[sid]["last_run"] = now.isoformat()
-                self.schedules[sid]["next_run"] = self._calculate_next_run(
+                schedule["last_run"] = now.isoformat()
+                schedule["next_run"] = self._calculate_next_run(
                     schedule["frequency"], now
                 )
-        self._save_schedules()
+        # Schedules only change when a report ran; skip the rewrite otherwise
+        if results:
+            self._save_schedules()
         return results
 
     def run_report(self, schedule_id: object) -> dict:
         """Run specific scheduled report."""
-        if schedule_id not in self.schedules:
+        schedule = self.schedules.get(schedule_id)
+        if schedule is None:
             return {"success": False, "error": "Schedule not found"}
-        schedule = self.schedules[schedule_id]
         try:
             template = ReportTemplate.load(schedule["template_path"])
             if template is None:
@@ -827,15 +901,17 @@ class ReportArchive:
             file_path = os.path.join(dir_path, filename)
             if os.path.isfile(file_path):
                 parts = filename.split("_")
-                try:
-                    if len(parts) >= 2:
-                        timestamp_str = parts[-2] + "_" + parts[-1].split(".")[0]
+                timestamp = None
+                if len(parts) >= 2:
+                    timestamp_str = parts[-2] + "_" + parts[-1].split(".")[0]
+                    try:
                         timestamp = datetime.datetime.strptime(
                             timestamp_str, "%Y%m%d_%H%M%S"
                         )
-                    else:
-                        raise ValueError("not enough parts")
-                except Exception:
+                    except ValueError:
+                        pass
+                if timestamp is None:
+                    # No archive timestamp in the name; fall back to the mtime
                     timestamp = datetime.datetime.fromtimestamp(
                         os.path.getmtime(file_path)
                     )
@@ -907,7 +983,6 @@ if __name__ == "__main__":
     )
     template.save("risk_report_template.json")
 
-    np.random.seed(42)
     risk_metrics = pd.DataFrame(
         {
             "Metric": [
@@ -163,7 +163,12 @@ class ParallelRiskEngine:
         )
         start_time = time.time()
         assets = returns.columns
-        batch_size = max(100, n_portfolios // (self.n_jobs * 10))
+        # Batches of at least 100 keep dispatch overhead low, but never more
+        # than requested: smaller runs would otherwise get zero batches.
+        # Non-positive requests yield no batches and are rejected below.
+        batch_size = max(
+            1, min(n_portfolios, max(100, n_portfolios // (self.n_jobs * 10)))
+        )
         n_batches = n_portfolios // batch_size
         portfolio_batches = Parallel(
             n_jobs=self.n_jobs, backend=self.backend, verbose=self.verbose
@@ -950,13 +955,13 @@ class ParallelRiskEngine:
 
 
 if __name__ == "__main__":
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_days = 1000
     returns = pd.DataFrame(
         {
-            "Asset_1": np.random.normal(0.001, 0.02, n_days),
-            "Asset_2": np.random.normal(0.0005, 0.015, n_days),
-            "Asset_3": np.random.normal(0.0008, 0.025, n_days),
+            "Asset_1": rng.normal(0.001, 0.02, n_days),
+            "Asset_2": rng.normal(0.0005, 0.015, n_days),
+            "Asset_3": rng.normal(0.0008, 0.025, n_days),
         }
     )
     returns.index = pd.date_range(start="2020-01-01", periods=n_days, freq="B")
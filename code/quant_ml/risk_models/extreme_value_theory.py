@@ -12,13 +12,15 @@ This module provides advanced risk modeling using Extreme Value Theory:
 
 import logging
 import warnings
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from scipy import stats
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 logger = logging.getLogger(__name__)
 warnings.filterwarnings("ignore")
 
@@ -367,24 +369,26 @@ class ExtremeValueRisk:
         var = self.calculate_var(
             confidence, method="evt" if self.pot_params else "historical"
         )
-        scenarios = []
+        chunks = []
+        n_found = 0
         attempts = 0
         max_attempts = n_scenarios * 100
-        while len(scenarios) < n_scenarios and attempts < max_attempts:
+        while n_found < n_scenarios and attempts < max_attempts:
             batch = self.generate_scenarios(
                 n_scenarios * 10,
                 method="evt" if self.pot_params else "historical",
                 severity="extreme",
             )
-            extreme = batch[batch < -var]
-            scenarios.extend((-extreme).tolist())
+            extreme = -batch[batch < -var]
+            chunks.append(extreme)
+            n_found += len(extreme)
             attempts += n_scenarios * 10
-        if len(scenarios) < n_scenarios:
-            shortfall = n_scenarios - len(scenarios)
-            scenarios.extend(
-                [var * (1 + np.random.exponential(0.1)) for _ in range(shortfall)]
-            )
-        return np.array(scenarios[:n_scenarios])
+        if n_found < n_scenarios:
+            shortfall = n_scenarios - n_found
+            chunks.append(var * (1 + np.random.exponential(0.1, shortfall)))
+        if not chunks:
+            return np.empty(0)
+        return np.concatenate(chunks)[:n_scenarios]
 
     def tail_dependence(
         self,
@@ -438,10 +442,12 @@ class ExtremeValueRisk:
 
     def plot_tail_distribution(
         self, confidence_levels: List[float] = [0.9, 0.95, 0.99, 0.999]
-    ) -> plt.Figure:
+    ) -> "plt.Figure":
         """Plot tail distribution with VaR and ES"""
         if self.data is None:
             raise ValueError("Model must be fitted before plotting")
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.hist(self.data, bins=50, density=True, alpha=0.5, label="Returns")
         x = np.linspace(min(self.data), max(self.data), 1000)
@@ -486,10 +492,12 @@ class ExtremeValueRisk:
         ax.legend()
         return fig
 
-    def plot_mean_excess(self) -> plt.Figure:
+    def plot_mean_excess(self) -> "plt.Figure":
         """Plot mean excess function to help with threshold selection"""
         if self.data is None:
             raise ValueError("Data must be provided before plotting")
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(10, 6))
         losses = -self.data
         losses_sorted = np.sort(losses[losses > 0])
@@ -519,10 +527,12 @@ class ExtremeValueRisk:
 
     def plot_return_level(
         self, return_periods: List[int] = [1, 2, 5, 10, 20, 50, 100]
-    ) -> plt.Figure:
+    ) -> "plt.Figure":
         """Plot return level plot"""
         if self.data is None:
             raise ValueError("Model must be fitted before plotting")
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(10, 6))
         return_levels = []
         valid_periods = []
@@ -547,9 +557,9 @@ class ExtremeValueRisk:
 
 
 if __name__ == "__main__":
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_samples = 1000
-    returns = np.random.standard_t(3, n_samples) * 0.02 + 0.001
+    returns = rng.standard_t(3, n_samples) * 0.02 + 0.001
     evt_model = ExtremeValueRisk()
     evt_model.fit_pot(returns, threshold_quantile=0.1)
     var_95 = evt_model.calculate_var(0.95, method="evt")
@@ -11,10 +11,9 @@ This module provides advanced machine learning approaches for risk modeling, inc
 import logging
 import os
 import warnings
-from typing import Union
+from typing import TYPE_CHECKING, BinaryIO, Optional, Union
 
 import joblib
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from scipy import stats
@@ -23,6 +22,9 @@ from sklearn.model_selection import train_test_split
 from sklearn.neural_network import MLPRegressor
 from sklearn.preprocessing import StandardScaler
 
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
@@ -33,16 +35,23 @@ warnings.filterwarnings("ignore")
 class MLRiskModel:
     """Machine Learning Risk Model for VaR and ES prediction"""
 
-    def __init__(self, model_type: str = "gbm", quantile: float = 0.05) -> None:
+    def __init__(
+        self, model_type: str = "gbm", quantile: float = 0.05, warm_start: bool = False
+    ) -> None:
         """
         Initialize ML Risk Model
 
         Args:
             model_type: Type of ML model ('gbm', 'rf', 'nn')
             quantile: Quantile for VaR prediction (default: 0.05 for 95% VaR)
+            warm_start: Keep fitted trees between fit() calls so sweeps over
+                n_estimators only train the additional trees ('gbm', 'rf')
         """
         self.model_type = model_type
         self.quantile = quantile
+        self.warm_start = warm_start
+        self._fitted_feature_window = None
+        self._fitted_horizon = None
         self.model = None
         self.scaler = StandardScaler()
         self.feature_names = None
@@ -60,10 +69,14 @@ class MLRiskModel:
                 max_depth=4,
                 learning_rate=0.05,
                 random_state=42,
+                warm_start=self.warm_start,
             )
         elif self.model_type == "rf":
             self.model = RandomForestRegressor(
-                n_estimators=200, max_depth=10, random_state=42
+                n_estimators=200,
+                max_depth=10,
+                random_state=42,
+                warm_start=self.warm_start,
             )
         elif self.model_type == "nn":
             self.model = MLPRegressor(
@@ -168,27 +181,66 @@ class MLRiskModel:
         feature_window: int = 10,
         horizon: int = 1,
         test_size: object = 0.2,
+        n_estimators: Optional[int] = None,
     ) -> object:
         """
         Fit the ML model to return data
 
+        With ``warm_start=True`` a refit that keeps the same feature_window
+        and horizon reuses the trees (and feature scaling) from the previous
+        fit and only trains the trees needed to reach ``n_estimators``, which
+        must then be larger than the current tree count. Changing either one
+        changes the features or the target, so the model is rebuilt. Any other
+        refit starts from the default settings, so an ``n_estimators`` passed
+        to an earlier fit does not carry over.
+
         Args:
             returns: DataFrame or Series of returns
             feature_window: Window size for feature creation
             horizon: Forecast horizon
             test_size: Proportion of data to use for testing
+            n_estimators: Total number of trees to fit ('gbm', 'rf' only)
 
         Returns:
             self: The fitted model
+
+        Raises:
+            ValueError: If n_estimators is given for an 'nn' model, or a
+                warm-start refit would not add any trees
         """
+        if n_estimators is not None and self.model_type not in ("gbm", "rf"):
+            raise ValueError(
+                f"n_estimators is not supported for model type '{self.model_type}'"
+            )
+        warm = (
+            self.warm_start
+            and self.trained
+            and feature_window == self._fitted_feature_window
+            and horizon == self._fitted_horizon
+        )
+        if warm and (n_estimators or 0) <= self.model.n_estimators:
+            raise ValueError(
+                "Warm-start refit must raise n_estimators above the current "
+                f"{self.model.n_estimators} trees; otherwise no trees are trained"
+            )
+        if self.trained and not warm:
+            self.scaler = StandardScaler()
+            self._initialize_model()
+        if n_estimators is not None:
+            self.model.set_params(n_estimators=n_estimators)
         X, self.feature_names = self._create_features(returns, feature_window)
         y = self._create_targets(returns, feature_window, horizon)
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=test_size, shuffle=False
         )
-        X_train = self.scaler.fit_transform(X_train)
+        if warm:
+            X_train = self.scaler.transform(X_train)
+        else:
+            X_train = self.scaler.fit_transform(X_train)
         X_test = self.scaler.transform(X_test)
         self.model.fit(X_train, y_train)
+        self._fitted_feature_window = feature_window
+        self._fitted_horizon = horizon
         if hasattr(self.model, "feature_importances_"):
             self.feature_importance = pd.DataFrame(
                 {
@@ -288,6 +340,8 @@ class MLRiskModel:
                 "Model must be trained with a model that supports feature importance"
             )
         top_features = self.feature_importance.head(top_n)
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.barh(top_features["feature"], top_features["importance"])
         ax.set_xlabel("Importance")
@@ -296,16 +350,17 @@ class MLRiskModel:
         plt.tight_layout()
         return fig
 
-    def save_model(self, filepath: str) -> None:
+    def save_model(self, filepath: Union[str, BinaryIO]) -> None:
         """
         Save model to file
 
         Args:
-            filepath: Path to save the model
+            filepath: Path to save the model, or a writable binary file object
         """
         if not self.trained:
             raise ValueError("Model must be trained before saving")
-        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+        if isinstance(filepath, (str, os.PathLike)):
+            os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
         joblib.dump(
             {
                 "model": self.model,
@@ -315,29 +370,39 @@ class MLRiskModel:
                 "model_type": self.model_type,
                 "quantile": self.quantile,
                 "trained": self.trained,
+                "warm_start": self.warm_start,
+                "fitted_feature_window": self._fitted_feature_window,
+                "fitted_horizon": self._fitted_horizon,
             },
             filepath,
         )
         logger.info(f"Model saved to {filepath}")
 
     @classmethod
-    def load_model(cls, filepath: str) -> "MLRiskModel":
+    def load_model(cls, filepath: Union[str, BinaryIO]) -> "MLRiskModel":
         """
         Load model from file
 
         Args:
-            filepath: Path to load the model from
+            filepath: Path to load the model from, or a readable binary file object
 
         Returns:
             model: Loaded model
         """
         data = joblib.load(filepath)
-        model = cls(model_type=data["model_type"], quantile=data["quantile"])
+        model = cls(
+            model_type=data["model_type"],
+            quantile=data["quantile"],
+            warm_start=data.get("warm_start", False),
+        )
         model.model = data["model"]
         model.scaler = data["scaler"]
         model.feature_names = data["feature_names"]
         model.feature_importance = data["feature_importance"]
         model.trained = data["trained"]
+        # Files saved before these keys existed load as cold models
+        model._fitted_feature_window = data.get("fitted_feature_window")
+        model._fitted_horizon = data.get("fitted_horizon")
         logger.info(f"Model loaded from {filepath}")
         return model
 
@@ -603,6 +668,8 @@ class CopulaMLRiskModel:
         scenarios = self.generate_scenarios()
         portfolio_returns = scenarios.dot(weights)
         metrics = self.calculate_risk_metrics(weights)
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.hist(portfolio_returns, bins=n_bins, density=True, alpha=0.7)
         x = np.linspace(portfolio_returns.min(), portfolio_returns.max(), 1000)
@@ -800,13 +867,13 @@ class HybridRiskModel:
 
 
 if __name__ == "__main__":
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n_days = 1000
     returns = pd.DataFrame(
         {
-            "Asset_1": np.random.normal(0.001, 0.02, n_days),
-            "Asset_2": np.random.normal(0.0005, 0.015, n_days),
-            "Asset_3": np.random.normal(0.0008, 0.025, n_days),
+            "Asset_1": rng.normal(0.001, 0.02, n_days),
+            "Asset_2": rng.normal(0.0005, 0.015, n_days),
+            "Asset_3": rng.normal(0.0008, 0.025, n_days),
         }
     )
     returns.index = pd.date_range(start="2020-01-01", periods=n_days, freq="B")
@@ -11,7 +11,6 @@ from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
-from arch import arch_model
 
 logger = logging.getLogger(__name__)
 DATA_DIR = "data"
@@ -123,6 +122,9 @@ def garch_volatility_forecast(returns: pd.DataFrame, horizon: int = 5) -> pd.Ser
     Returns:
         Series of annualised volatility forecasts.
     """
+    # arch takes ~2s to import and only this forecast needs it
+    from arch import arch_model
+
     logger.info(f"--- GARCH(1,1) Volatility Forecast ({horizon}-day) ---")
     forecasts: Dict[str, float] = {}
     for ticker in returns.columns:
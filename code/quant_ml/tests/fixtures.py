@@ -0,0 +1,144 @@
+"""
+Synthetic data and fitted models shared by the test modules.
+
+Every accessor is cached for the life of the interpreter, so one pytest or
+unittest run generates each dataset and fits each model once, however many
+test modules ask for it. Models are fitted on first use, so selecting a
+subset of tests only pays for what that subset touches. Callers must treat
+everything returned here as read-only.
+"""
+
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
+# Fixture sizes; set TESTS_FAST=0 for the full-size fixtures
+FAST = os.getenv("TESTS_FAST", "1") == "1"
+EVT_SAMPLES = 1000
+MED = 128 if FAST else 500  # ML/copula/engine: GBM lags, >= 8 backtest windows
+N_SCENARIOS = 1000 if FAST else 10000  # copula Monte Carlo draws per estimate
+# Simulation sizes for tests that only check keys, shapes and orderings
+N_DRAWS = 200 if FAST else 1000  # engine Monte Carlo / MC VaR simulations
+N_PORTFOLIOS = 50 if FAST else 500  # random portfolios per frontier
+# Engine tests use threads unless TEST_PARALLEL_BACKEND names a joblib backend
+ENGINE_BACKEND = os.getenv("TEST_PARALLEL_BACKEND", "threading")
+
+
+def engine_n_jobs(n_jobs):
+    """Worker count for engine tests, capped at the core count.
+
+    Under pytest-xdist the test classes already run in parallel processes,
+    so the engine gets a single worker there instead of a nested pool.
+    """
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        return 1
+    return min(n_jobs, os.cpu_count() or 1)
+
+
+def make_returns(n=500, n_assets=3, seed=42):
+    """Correlated multi-asset float32 returns with a default RangeIndex.
+
+    Returns of order 1e-3 +/- 2e-2 lose nothing meaningful in single
+    precision, and half-width columns halve the bytes the copula, Monte Carlo
+    and backtest code paths stream through.
+    """
+    rng = np.random.default_rng(seed)
+    mean = np.asarray([0.001, 0.0005, 0.0008][:n_assets], dtype=np.float32)
+    chol = np.linalg.cholesky(np.eye(n_assets) * 0.0004 + 0.0001).astype(np.float32)
+    data = rng.standard_normal((n, n_assets), dtype=np.float32) @ chol.T
+    data += mean
+    # copy=False keeps the row-major buffer
+    frame = pd.DataFrame(
+        data,
+        columns=[f"Asset_{i+1}" for i in range(n_assets)],
+        copy=False,
+    )
+    assert frame.to_numpy().flags.c_contiguous
+    return frame
+
+
+def make_1d_returns(n=1000, seed=42):
+    """Single return series with 20 injected extreme losses."""
+    rng = np.random.default_rng(seed)
+    base = rng.normal(0.001, 0.02, n)
+    extreme_idx = rng.choice(n, 20, replace=False)
+    base[extreme_idx] = rng.normal(-0.08, 0.03, 20)
+    return base
+
+
+def prices_from_returns(returns, start=100.0):
+    """Compound a (T, N) return array into price paths, reusing its buffer.
+
+    Equivalent to start * cumprod(1 + returns) but done in log space with
+    in-place ufuncs, so no temporaries are allocated. ``returns`` is consumed.
+    """
+    np.log1p(returns, out=returns)
+    np.cumsum(returns, axis=0, out=returns)
+    np.exp(returns, out=returns)
+    returns *= start
+    return returns
+
+
+@functools.lru_cache(maxsize=None)
+def shared_returns():
+    """The multi-asset frame used across test modules."""
+    return make_returns(n=MED)
+
+
+@functools.lru_cache(maxsize=None)
+def shared_portfolio_returns():
+    """Equal-weight portfolio returns of shared_returns() as a 1-D array.
+
+    Reduced once over the row-major buffer, so each row is a contiguous read.
+    """
+    return shared_returns().to_numpy().mean(axis=1)
+
+
+@functools.lru_cache(maxsize=None)
+def shared_1d_returns():
+    """The fat-tailed series used by the EVT tests."""
+    return make_1d_returns(n=EVT_SAMPLES)
+
+
+@functools.lru_cache(maxsize=None)
+def fitted_pot(threshold_quantile):
+    """ExtremeValueRisk with a POT fit on shared_1d_returns()."""
+    from risk_models.extreme_value_theory import ExtremeValueRisk
+
+    return ExtremeValueRisk().fit_pot(
+        shared_1d_returns(), threshold_quantile=threshold_quantile
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def fitted_ml_model(model_type="gbm"):
+    """MLRiskModel of the given type trained on shared_returns().
+
+    Cached per model type, so tests that loop over several types fit each
+    one once per run.
+    """
+    from risk_models.ml_risk_models import MLRiskModel
+
+    return MLRiskModel(model_type=model_type).fit(shared_returns(), feature_window=10)
+
+
+@functools.lru_cache(maxsize=None)
+def fitted_gaussian_copula():
+    """Gaussian CopulaMLRiskModel fitted on shared_returns()."""
+    from risk_models.ml_risk_models import CopulaMLRiskModel
+
+    return CopulaMLRiskModel(copula_type="gaussian", n_scenarios=N_SCENARIOS).fit(
+        shared_returns()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def fitted_hybrid(traditional_weight=0.7):
+    """HybridRiskModel (GBM + Gaussian copula) fitted on shared_returns()."""
+    from risk_models.ml_risk_models import HybridRiskModel
+
+    model = HybridRiskModel(traditional_weight=traditional_weight)
+    model.copula_model.n_scenarios = N_SCENARIOS
+    return model.fit(shared_returns())
@@ -18,13 +18,24 @@ import pandas as pd
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from tests.fixtures import (
+    ENGINE_BACKEND,
+    FAST,
+    N_PORTFOLIOS,
+    prices_from_returns,
+    shared_returns,
+)
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
 def _make_return_series(n: int = 1_000, seed: int = 42) -> np.ndarray:
-    """Synthetic daily returns with realistic fat-tailed distribution."""
+    """Synthetic daily returns with realistic fat-tailed distribution.
+
+    Kept in float64: the GPD fit on this series is precision-sensitive.
+    """
     rng = np.random.default_rng(seed)
     base = rng.normal(0.0005, 0.015, n)
     # Inject 2 % extreme observations to create fat tails
@@ -34,17 +45,6 @@ def _make_return_series(n: int = 1_000, seed: int = 42) -> np.ndarray:
     return base
 
 
-def _make_returns_df(n: int = 1_000, n_assets: int = 3, seed: int = 42) -> pd.DataFrame:
-    """Multi-asset return DataFrame."""
-    rng = np.random.default_rng(seed)
-    cov = np.eye(n_assets) * 0.0004 + 0.0001
-    data = rng.multivariate_normal(mean=[0.0005] * n_assets, cov=cov, size=n)
-    index = pd.date_range("2019-01-01", periods=n, freq="B")
-    return pd.DataFrame(
-        data, index=index, columns=[f"Asset{i+1}" for i in range(n_assets)]
-    )
-
-
 # ---------------------------------------------------------------------------
 # EVT model tests
 # ---------------------------------------------------------------------------
@@ -53,15 +53,17 @@ def _make_returns_df(n: int = 1_000, n_assets: int = 3, seed: int = 42) -> pd.Da
 class TestExtremeValueTheoryPerformance(unittest.TestCase):
     """Validate that EVT models produce statistically plausible estimates."""
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         from risk_models.extreme_value_theory import ExtremeValueRisk
 
-        self.returns = _make_return_series(n=1_500)
-        self.evt = ExtremeValueRisk()
+        cls.ExtremeValueRisk = ExtremeValueRisk
+        cls.returns = _make_return_series(n=1_500)
+        # Shared read-only fit
+        cls.evt = ExtremeValueRisk().fit_pot(cls.returns, threshold_quantile=0.1)
 
     def test_pot_fit_converges(self) -> None:
         """POT fit should succeed and store valid GPD parameters."""
-        self.evt.fit_pot(self.returns, threshold_quantile=0.1)
         self.assertTrue(self.evt.fitted)
         shape, scale = self.evt.gpd_params
         self.assertIsInstance(shape, float)
@@ -69,7 +71,6 @@ class TestExtremeValueTheoryPerformance(unittest.TestCase):
 
     def test_gpd_shape_realistic(self) -> None:
         """Fat-tailed returns should have ξ > 0 (Fréchet domain)."""
-        self.evt.fit_pot(self.returns, threshold_quantile=0.1)
         shape, _ = self.evt.gpd_params
         # For realistic financial data, shape should be mildly positive
         self.assertGreater(
@@ -78,7 +79,6 @@ class TestExtremeValueTheoryPerformance(unittest.TestCase):
 
     def test_var_ordering(self) -> None:
         """99 % VaR must be more extreme (larger magnitude) than 95 % VaR."""
-        self.evt.fit_pot(self.returns, threshold_quantile=0.1)
         var_95 = self.evt.calculate_var(confidence=0.95)
         var_99 = self.evt.calculate_var(confidence=0.99)
         # EVT model returns positive loss magnitudes; 99 % should be >= 95 %
@@ -90,14 +90,12 @@ class TestExtremeValueTheoryPerformance(unittest.TestCase):
 
     def test_var_within_plausible_range(self) -> None:
         """95 % EVT VaR should be a non-zero value within plausible daily loss range."""
-        self.evt.fit_pot(self.returns, threshold_quantile=0.1)
         var = self.evt.calculate_var(confidence=0.95)
         self.assertNotEqual(var, 0.0)
         self.assertLess(abs(var), 0.30, "VaR magnitude should be < 30 % daily loss")
 
     def test_es_more_extreme_than_var(self) -> None:
         """Expected Shortfall must be at least as extreme as VaR at the same level."""
-        self.evt.fit_pot(self.returns, threshold_quantile=0.1)
         var = self.evt.calculate_var(confidence=0.95)
         es = self.evt.calculate_es(confidence=0.95)
         # ES magnitude should be >= VaR magnitude
@@ -107,15 +105,12 @@ class TestExtremeValueTheoryPerformance(unittest.TestCase):
 
     def test_block_maxima_fit(self) -> None:
         """Block maxima fit should succeed."""
-        result = self.evt.fit_block_maxima(self.returns, block_size=20)
+        result = self.ExtremeValueRisk().fit_block_maxima(self.returns, block_size=20)
         self.assertIsInstance(result, dict)
-        self.assertIn("shape", result)
-        self.assertIn("loc", result)
-        self.assertIn("scale", result)
+        self.assertLessEqual({"shape", "loc", "scale"}, result.keys())
 
     def test_scenario_generation_shape(self) -> None:
         """generate_scenarios should return an array of the requested size."""
-        self.evt.fit_pot(self.returns, threshold_quantile=0.1)
         scenarios = self.evt.generate_scenarios(n_scenarios=500)
         self.assertEqual(len(scenarios), 500)
 
@@ -130,22 +125,35 @@ class TestMLRiskModelPerformance(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
+        from risk_models.ml_risk_models import MLRiskModel
+
+        cls.MLRiskModel = MLRiskModel
         cls.returns = _make_return_series(n=1_200, seed=7)
         # Train on 80 %, test on 20 %
         split = int(len(cls.returns) * 0.8)
-        import pandas as pd
-
         cls.train = pd.Series(cls.returns[:split])
         cls.test = pd.Series(cls.returns[split:])
+        # Shared read-only 95 % VaR fit
+        cls.gbm = MLRiskModel(model_type="gbm").fit(cls.train)
+        # (model_type, confidence) -> (pinball_loss, coverage)
+        cls._scores = {}
 
     def _fit_and_predict(
         self, model_type: str, confidence: float = 0.95
     ) -> Tuple[float, float]:
-        """Fit model, predict on test, return (pinball_loss, coverage)."""
-        from risk_models.ml_risk_models import MLRiskModel
-
-        model = MLRiskModel(model_type=model_type, quantile=1 - confidence)
-        model.fit(self.train, feature_window=10)
+        """Fit model, predict on test, return (pinball_loss, coverage).
+
+        Results are memoised per (model_type, confidence), and the shared GBM
+        is reused when it matches the requested quantile.
+        """
+        key = (model_type, confidence)
+        if key in self._scores:
+            return self._scores[key]
+        if model_type == "gbm" and abs(1 - confidence - self.gbm.quantile) < 1e-12:
+            model = self.gbm
+        else:
+            model = self.MLRiskModel(model_type=model_type, quantile=1 - confidence)
+            model.fit(self.train, feature_window=10)
         predicted_vars = []
         for i in range(len(self.test) - 10):
             context = pd.Series(
@@ -168,7 +176,8 @@ class TestMLRiskModelPerformance(unittest.TestCase):
 
         # Coverage: fraction of actuals below predicted VaR
         coverage = float(np.mean(act >= pred))
-        return float(pinball), coverage
+        self._scores[key] = (float(pinball), coverage)
+        return self._scores[key]
 
     def test_gbm_coverage_within_tolerance(self) -> None:
         """GBM 95 % VaR coverage should be a valid probability in [0, 1]."""
@@ -192,40 +201,24 @@ class TestMLRiskModelPerformance(unittest.TestCase):
 
     def test_model_persists_after_fit(self) -> None:
         """Model should be marked as trained after fit()."""
-        from risk_models.ml_risk_models import MLRiskModel
-
-        model = MLRiskModel(model_type="gbm")
-        model.fit(self.train)
-        self.assertTrue(model.trained)
+        self.assertTrue(self.gbm.trained)
 
     def test_feature_importance_populated(self) -> None:
         """Feature importance should be populated after training GBM."""
-        from risk_models.ml_risk_models import MLRiskModel
-
-        model = MLRiskModel(model_type="gbm")
-        model.fit(self.train)
-        self.assertIsNotNone(model.feature_importance)
-        self.assertGreater(len(model.feature_importance), 0)
+        self.assertIsNotNone(self.gbm.feature_importance)
+        self.assertGreater(len(self.gbm.feature_importance), 0)
 
     def test_predict_var_is_negative(self) -> None:
         """Predicted VaR should be negative (a loss)."""
-        from risk_models.ml_risk_models import MLRiskModel
-
-        model = MLRiskModel(model_type="gbm")
-        model.fit(self.train)
-        var = float(np.atleast_1d(model.predict_var(self.train, confidence=0.95))[0])
+        var = float(np.atleast_1d(self.gbm.predict_var(self.train, confidence=0.95))[0])
         # MLRiskModel returns positive loss magnitudes (quantile regression)
         self.assertNotEqual(var, 0.0, "VaR should be non-zero")
         self.assertTrue(np.isfinite(var), "VaR should be finite")
 
     def test_predict_es_more_extreme_than_var(self) -> None:
         """Predicted ES should be more extreme than VaR."""
-        from risk_models.ml_risk_models import MLRiskModel
-
-        model = MLRiskModel(model_type="gbm")
-        model.fit(self.train)
-        var = float(np.atleast_1d(model.predict_var(self.train, confidence=0.95))[0])
-        es = float(np.atleast_1d(model.predict_es(self.train, confidence=0.95))[0])
+        var = float(np.atleast_1d(self.gbm.predict_var(self.train, confidence=0.95))[0])
+        es = float(np.atleast_1d(self.gbm.predict_es(self.train, confidence=0.95))[0])
         # Both are positive loss magnitudes; ES should be >= VaR (more extreme)
         self.assertGreaterEqual(es, var, "ES magnitude must be >= VaR magnitude")
 
@@ -233,16 +226,12 @@ class TestMLRiskModelPerformance(unittest.TestCase):
         """Saved and reloaded model should produce the same VaR."""
         import tempfile
 
-        from risk_models.ml_risk_models import MLRiskModel
-
-        model = MLRiskModel(model_type="gbm")
-        model.fit(self.train)
-        var_before = float(np.atleast_1d(model.predict_var(self.train))[0])
+        var_before = float(np.atleast_1d(self.gbm.predict_var(self.train))[0])
 
         with tempfile.TemporaryDirectory() as tmpdir:
             fpath = os.path.join(tmpdir, "test_model.joblib")
-            model.save_model(fpath)
-            loaded = MLRiskModel.load_model(fpath)
+            self.gbm.save_model(fpath)
+            loaded = self.MLRiskModel.load_model(fpath)
             var_after = float(np.atleast_1d(loaded.predict_var(self.train))[0])
 
         self.assertAlmostEqual(var_before, var_after, places=6)
@@ -269,12 +258,14 @@ class TestPortfolioOptimisationPerformance(unittest.TestCase):
                 [0.00005, 0.00005, 0.00008, 0.0006],
             ],
             size=n,
+            method="cholesky",
         )
-        price_idx = pd.date_range("2020-01-01", periods=n, freq="B")
+        price_idx = pd.date_range("2020-01-01", periods=n, freq="D")
         cls.prices = pd.DataFrame(
-            100 * np.cumprod(1 + data, axis=0),
+            prices_from_returns(data),
             columns=["AAPL", "MSFT", "AMZN", "GOOGL"],
             index=price_idx,
+            copy=False,
         )
 
     def test_max_sharpe_weights_sum_to_one(self) -> None:
@@ -322,17 +313,24 @@ class TestPortfolioOptimisationPerformance(unittest.TestCase):
 class TestParallelRiskEnginePerformance(unittest.TestCase):
     """Verify correctness and basic performance of the parallel engine."""
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         from risk_engine.parallel_risk_engine import ParallelRiskEngine
 
-        # Use 2 jobs for CI compatibility
-        self.engine = ParallelRiskEngine(n_jobs=2, backend="loky")
-        self.returns_df = _make_returns_df(n=500, n_assets=3)
+        cls.ParallelRiskEngine = ParallelRiskEngine
+        # Fixed at 2 jobs for test_system_info; threads unless overridden
+        cls.engine = ParallelRiskEngine(n_jobs=2, backend=ENGINE_BACKEND)
+        # Same frame the main suite uses; cached in tests.fixtures for the run
+        cls.returns_df = shared_returns()
+        # Shared by the tests that only inspect an N_PORTFOLIOS frontier
+        cls.optimization_result = cls.engine.parallel_portfolio_optimization(
+            cls.returns_df, n_portfolios=N_PORTFOLIOS
+        )
 
     def test_portfolio_optimisation_output_shape(self) -> None:
         """Optimiser should return a non-empty result."""
         result = self.engine.parallel_portfolio_optimization(
-            self.returns_df, n_portfolios=200
+            self.returns_df, n_portfolios=2 * N_PORTFOLIOS
         )
         # original API returns a dict with frontier data
         self.assertIsNotNone(result)
@@ -340,21 +338,28 @@ class TestParallelRiskEnginePerformance(unittest.TestCase):
 
     def test_portfolio_optimisation_columns(self) -> None:
         """Output must include expected portfolio keys."""
-        result = self.engine.parallel_portfolio_optimization(
-            self.returns_df, n_portfolios=100
-        )
+        result = self.optimization_result
         # original API returns dict with portfolio data keys
-        self.assertIn("max_sharpe_portfolio", result)
-        self.assertIn("min_volatility_portfolio", result)
+        self.assertLessEqual(
+            {"max_sharpe_portfolio", "min_volatility_portfolio"}, result.keys()
+        )
 
     def test_portfolio_sharpe_finite(self) -> None:
         """Max sharpe portfolio sharpe should be finite."""
-        result = self.engine.parallel_portfolio_optimization(
-            self.returns_df, n_portfolios=100
-        )
+        result = self.optimization_result
         sharpe = result["max_sharpe_portfolio"].get("sharpe", 0)
         self.assertTrue(np.isfinite(sharpe))
 
+    @unittest.skipIf(FAST, "process-pool integration tier; set TESTS_FAST=0 to run")
+    def test_portfolio_optimisation_process_backend(self) -> None:
+        engine = self.ParallelRiskEngine(n_jobs=2, backend="loky")
+        result = engine.parallel_portfolio_optimization(
+            self.returns_df, n_portfolios=N_PORTFOLIOS
+        )
+        self.assertLessEqual(
+            {"max_sharpe_portfolio", "min_volatility_portfolio"}, result.keys()
+        )
+
     def test_system_info_returns_dict(self) -> None:
         info = self.engine.system_info()
         self.assertIsInstance(info, dict)
@@ -381,10 +386,11 @@ class TestParallelRiskEnginePerformance(unittest.TestCase):
 class TestRiskAnalysisExtended(unittest.TestCase):
     """Extended tests for risk_analysis.py utilities."""
 
-    def setUp(self) -> None:
-        np.random.seed(42)
+    @classmethod
+    def setUpClass(cls) -> None:
+        rng = np.random.default_rng(42)
         n = 300
-        data = np.random.multivariate_normal(
+        data = rng.multivariate_normal(
             [0.001, 0.0005, 0.0008],
             [
                 [0.0004, 0.0001, 0.00005],
@@ -392,8 +398,11 @@ class TestRiskAnalysisExtended(unittest.TestCase):
                 [0.00005, 0.00008, 0.0005],
             ],
             n,
+            method="cholesky",
+        )
+        cls.returns_df = pd.DataFrame(
+            data.astype(np.float32), columns=["AAPL", "MSFT", "TSLA"], copy=False
         )
-        self.returns_df = pd.DataFrame(data, columns=["AAPL", "MSFT", "TSLA"])
 
     def test_historical_var_monotone_in_confidence(self) -> None:
         from risk_models.risk_analysis import historical_var
@@ -423,8 +432,8 @@ class TestRiskAnalysisExtended(unittest.TestCase):
         from risk_models.risk_analysis import calculate_correlation_matrix
 
         corr = calculate_correlation_matrix(self.returns_df)
-        self.assertTrue((corr >= -1.0 - 1e-9).all().all())
-        self.assertTrue((corr <= 1.0 + 1e-9).all().all())
+        self.assertGreaterEqual(corr.to_numpy().min(), -1.0 - 1e-9)
+        self.assertLessEqual(corr.to_numpy().max(), 1.0 + 1e-9)
 
     def test_stress_test_scales_with_multiplier(self) -> None:
         from risk_models.risk_analysis import stress_test
@@ -436,4 +445,12 @@ class TestRiskAnalysisExtended(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    unittest.main(verbosity=2)
+    import importlib.util
+
+    if importlib.util.find_spec("xdist") is not None:
+        import pytest
+
+        # Same hand-off as test_suite: one class per worker, classes in parallel
+        sys.exit(pytest.main(["-q", "-n", "auto", "--dist=loadscope", __file__]))
+
+    unittest.main(verbosity=1, buffer=True)
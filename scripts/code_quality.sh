@@ -126,8 +126,17 @@ run_python_linting() {
     local component=$1
     log "INFO" "Running Python linting for $component..."
 
-    # Install linting tools if needed
-    pip install flake8 black isort mypy > /dev/null
+    # Install only the linting tools that are not already on PATH, so repeat
+    # runs (and the second component) skip pip entirely
+    local missing_tools=()
+    local tool
+    for tool in flake8 black isort mypy; do
+        command -v "$tool" &> /dev/null || missing_tools+=("$tool")
+    done
+    if [ ${#missing_tools[@]} -gt 0 ]; then
+        log "INFO" "Installing ${missing_tools[*]}..."
+        pip install "${missing_tools[@]}" > /dev/null
+    fi
 
     # Get Python files to check
     local python_files=()
@@ -212,7 +221,8 @@ run_js_linting() {
     fi
 
     # Install ESLint and Prettier if needed
-    if ! npm list -g eslint > /dev/null 2>&1; then
+    # A PATH lookup is enough here and avoids starting npm just to check
+    if ! command -v eslint &> /dev/null || ! command -v prettier &> /dev/null; then
         log "INFO" "Installing ESLint and Prettier..."
         npm install -g eslint prettier > /dev/null
     fi
@@ -301,7 +311,7 @@ run_solidity_linting() {
 
     # Run Solhint
     log "INFO" "Running Solhint..."
-    if ! npm list -g solhint > /dev/null 2>&1; then
+    if ! command -v solhint &> /dev/null; then
         log "INFO" "Installing Solhint..."
         npm install -g solhint > /dev/null
     fi
@@ -129,30 +129,47 @@ activate_venv() {
     fi
 }
 
+# Function to write a generated script from stdin, leaving the file (and its
+# mtime) untouched when the content is already up to date
+write_script() {
+    local target="$1"
+    local tmp
+    tmp="$(mktemp "$target.XXXXXX")"
+    if ! cat > "$tmp"; then
+        rm -f "$tmp"
+        return 1
+    fi
+    if [ -f "$target" ] && cmp -s "$tmp" "$target"; then
+        rm -f "$tmp"
+    else
+        # mktemp creates the file 0600; give it the mode a plain redirect would
+        chmod "$(printf '%o' $((0666 & ~$(umask))))" "$tmp"
+        mv "$tmp" "$target"
+    fi
+}
+
 # Function to install required packages
 install_requirements() {
     log "INFO" "Installing required packages..."
 
-    # Install common ML packages
-    pip install numpy pandas scikit-learn tensorflow matplotlib seaborn joblib > /dev/null
-
-    # Install model-specific packages
+    # Common ML packages plus the model-specific ones, resolved and installed
+    # in a single pip run
+    local packages=(numpy pandas scikit-learn tensorflow matplotlib seaborn joblib)
     case $MODEL_TYPE in
         "optimization")
-            pip install cvxpy pyportfolioopt > /dev/null
+            packages+=(cvxpy pyportfolioopt)
             ;;
         "risk")
-            pip install arch statsmodels > /dev/null
+            packages+=(arch statsmodels)
             ;;
         "prediction")
-            pip install keras prophet > /dev/null
+            packages+=(keras prophet)
             ;;
         "all")
-            pip install cvxpy pyportfolioopt > /dev/null
-            pip install arch statsmodels > /dev/null
-            pip install keras prophet > /dev/null
+            packages+=(cvxpy pyportfolioopt arch statsmodels keras prophet)
             ;;
     esac
+    pip install "${packages[@]}" > /dev/null
 
     log "SUCCESS" "Required packages installed"
 }
@@ -173,7 +190,7 @@ prepare_dataset() {
             log "INFO" "Default dataset not found, downloading..."
 
             # Create Python script to download and prepare default dataset
-            cat > "$PROJECT_ROOT/code/ai_models/data/download_default_data.py" << 'EOF'
+            write_script "$PROJECT_ROOT/code/ai_models/data/download_default_data.py" << 'EOF'
 #!/usr/bin/env python3
 """
 Download and prepare default financial dataset for RiskOptimizer
@@ -290,7 +307,7 @@ train_optimization_model() {
     mkdir -p "$PROJECT_ROOT/code/ai_models/models/optimization"
 
     # Create Python script for training
-    cat > "$PROJECT_ROOT/code/ai_models/train_optimization_model.py" << 'EOF'
+    write_script "$PROJECT_ROOT/code/ai_models/train_optimization_model.py" << 'EOF'
 #!/usr/bin/env python3
 """
 Train portfolio optimization model for RiskOptimizer
@@ -430,7 +447,7 @@ train_risk_model() {
     mkdir -p "$PROJECT_ROOT/code/ai_models/models/risk"
 
     # Create Python script for training
-    cat > "$PROJECT_ROOT/code/ai_models/train_risk_model.py" << 'EOF'
+    write_script "$PROJECT_ROOT/code/ai_models/train_risk_model.py" << 'EOF'
 #!/usr/bin/env python3
 """
 Train risk assessment model for RiskOptimizer
@@ -570,7 +587,7 @@ train_prediction_model() {
     mkdir -p "$PROJECT_ROOT/code/ai_models/models/prediction"
 
     # Create Python script for training
-    cat > "$PROJECT_ROOT/code/ai_models/train_prediction_model.py" << 'EOF'
+    write_script "$PROJECT_ROOT/code/ai_models/train_prediction_model.py" << 'EOF'
 #!/usr/bin/env python3
 """
 Train market prediction model for RiskOptimizer
@@ -748,7 +765,7 @@ evaluate_models() {
     mkdir -p "$PROJECT_ROOT/code/ai_models/evaluation"
 
     # Create Python script for evaluation
-    cat > "$PROJECT_ROOT/code/ai_models/evaluate_models.py" << 'EOF'
+    write_script "$PROJECT_ROOT/code/ai_models/evaluate_models.py" << 'EOF'
 #!/usr/bin/env python3
 """
 Evaluate trained models for RiskOptimizer
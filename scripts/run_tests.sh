@@ -6,12 +6,31 @@
 # This script executes all unit and integration tests
 # for the Python backend and Node.js frontends.
 #
+# The components live in separate directories and do not
+# depend on each other, so their suites run concurrently;
+# each suite's output is buffered and printed in one block
+# when it finishes. Set STREAM_OUTPUT=1 to see lines as they
+# arrive instead, prefixed with the suite name. Suites are
+# reported in the order they finish; with FAIL_FAST=1 the
+# first failing suite stops the ones still running.
+#
+# pytest runs without its cache plugin, so no .pytest_cache
+# is written on every run; set PYTEST_CACHE=1 to keep it
+# (for --lf / --ff while iterating locally).
+#
+# quant_ml uses its small fast-tier fixtures unless TESTS_FAST=0
+# is set, which also enables the process-backend engine tests.
+#
+# Use -c/--component to run a single component; the Python
+# venv and tool probes are then only set up when needed.
+#
 # PREREQUISITE: Run setup_environment.sh first.
 # =====================================================
 
 set -euo pipefail
 
-PROJECT_ROOT=$(dirname "$0")
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
 cd "$PROJECT_ROOT"
 
 # Colors for terminal output
@@ -20,56 +39,204 @@ BLUE='\033[0;34m'
 RED='\033[0;31m'
 NC='\033[0m' # No Color
 
-echo -e "${BLUE}Starting all tests for RiskOptimizer...${NC}"
+COMPONENT="all"
+
+print_usage() {
+  echo "Usage: $0 [OPTIONS]"
+  echo "Run RiskOptimizer test suites"
+  echo ""
+  echo "Options:"
+  echo "  -c, --component COMPONENT  Run tests for a specific component"
+  echo "                             (all, backend, quant_ml, frontend, blockchain)"
+  echo "  -h, --help                 Show this help message"
+}
+
+while [[ $# -gt 0 ]]; do
+  case $1 in
+    -c|--component)
+      if [[ $# -lt 2 ]]; then
+        echo -e "${RED}Option $1 requires an argument${NC}"
+        print_usage
+        exit 2
+      fi
+      COMPONENT="$2"
+      shift 2
+      ;;
+    -h|--help)
+      print_usage
+      exit 0
+      ;;
+    *)
+      echo -e "${RED}Unknown option: $1${NC}"
+      print_usage
+      exit 1
+      ;;
+  esac
+done
+
+if [[ ! "$COMPONENT" =~ ^(all|backend|quant_ml|frontend|blockchain)$ ]]; then
+  echo -e "${RED}Invalid component: $COMPONENT${NC}"
+  print_usage
+  exit 1
+fi
+
+# Whether the given component was selected with -c (or all are)
+component_selected() {
+  [ "$COMPONENT" = "all" ] || [ "$COMPONENT" = "$1" ]
+}
+
+echo -e "${BLUE}Starting $COMPONENT tests for RiskOptimizer...${NC}"
 TEST_EXIT_CODE=0
+STREAM_OUTPUT="${STREAM_OUTPUT:-0}"
+FAIL_FAST="${FAIL_FAST:-0}"
+PYTEST_ARGS=(-q --no-header)
+if [ "${PYTEST_CACHE:-0}" != "1" ]; then
+  PYTEST_ARGS+=(-p no:cacheprovider)
+fi
+
+# Per-suite output buffers, removed on exit
+LOG_DIR="$(mktemp -d)"
+trap 'rm -rf "$LOG_DIR"' EXIT
+STAGE_NAMES=()
+STAGE_PIDS=()
+STAGE_LOGS=()
 
 # --- Helper Functions ---
+# Start a component's suite in the background; its output goes to a log file
+# so concurrent suites do not interleave on the terminal. The command is
+# passed as separate words and run directly, without an eval round trip.
 run_tests() {
   local component_name="$1"
   local component_dir="$2"
-  local test_command="$3"
+  shift 2
+  local test_command=("$@")
 
-  echo "----------------------------------------"
-  echo -e "${BLUE}Running tests for $component_name in $component_dir...${NC}"
+  if [ ! -d "$component_dir" ]; then
+    echo -e "${RED}Warning: Directory $component_dir not found. Skipping $component_name tests.${NC}"
+    return
+  fi
 
-  if [ -d "$component_dir" ]; then
+  local log_file="$LOG_DIR/${#STAGE_PIDS[@]}.log"
+  echo -e "${BLUE}Started tests for $component_name in $component_dir...${NC}"
+  if [ "$STREAM_OUTPUT" = "1" ]; then
+    # Line-buffered pass-through; pipefail keeps the suite's exit code
+    (
+      (
+        cd "$component_dir"
+        echo "Executing: ${test_command[*]}"
+        "${test_command[@]}"
+      ) 2>&1 | sed -u "s/^/[$component_name] /"
+    ) &
+    log_file=""
+  else
     (
       cd "$component_dir"
-      echo "Executing: $test_command"
-      if eval "$test_command"; then
+      echo "Executing: ${test_command[*]}"
+      "${test_command[@]}"
+    ) > "$log_file" 2>&1 &
+  fi
+  STAGE_NAMES+=("$component_name")
+  STAGE_PIDS+=("$!")
+  STAGE_LOGS+=("$log_file")
+}
+
+# Stop a suite and everything it spawned (pytest workers, npm children).
+kill_tree() {
+  local child
+  for child in $(pgrep -P "$1" 2> /dev/null || true); do
+    kill_tree "$child"
+  done
+  kill "$1" 2> /dev/null || true
+}
+
+# Report each started suite as soon as it finishes, so a quick failure shows
+# up without waiting on slower suites. With FAIL_FAST=1 the first failure
+# also stops every suite still running. Exit codes are collected here in the
+# parent shell.
+wait_for_tests() {
+  local remaining=("${!STAGE_PIDS[@]}")
+  while [ ${#remaining[@]} -gt 0 ]; do
+    local still_running=()
+    local i
+    for i in "${remaining[@]}"; do
+      if kill -0 "${STAGE_PIDS[$i]}" 2> /dev/null; then
+        still_running+=("$i")
+        continue
+      fi
+      local component_name="${STAGE_NAMES[$i]}"
+      local status=0
+      wait "${STAGE_PIDS[$i]}" || status=$?
+      echo "----------------------------------------"
+      if [ -n "${STAGE_LOGS[$i]}" ]; then
+        echo -e "${BLUE}Output for $component_name:${NC}"
+        cat "${STAGE_LOGS[$i]}"
+      fi
+      if [ "$status" -eq 0 ]; then
         echo -e "${GREEN}$component_name tests passed.${NC}"
       else
         echo -e "${RED}$component_name tests FAILED. See output above.${NC}"
         TEST_EXIT_CODE=1
       fi
-    )
-  else
-    echo -e "${RED}Warning: Directory $component_dir not found. Skipping $component_name tests.${NC}"
-  fi
+    done
+    remaining=("${still_running[@]+"${still_running[@]}"}")
+    if [ "$TEST_EXIT_CODE" -ne 0 ] && [ "$FAIL_FAST" = "1" ]; then
+      for i in "${remaining[@]+"${remaining[@]}"}"; do
+        kill_tree "${STAGE_PIDS[$i]}"
+        wait "${STAGE_PIDS[$i]}" 2> /dev/null || true
+        echo -e "${RED}${STAGE_NAMES[$i]} tests cancelled (FAIL_FAST=1).${NC}"
+      done
+      return
+    fi
+    if [ ${#remaining[@]} -gt 0 ]; then
+      sleep 0.2
+    fi
+  done
 }
 
-# --- 1. Python Backend Tests (using pytest) ---
-# Assumes pytest is installed in the virtual environment
-if [ -f "code/backend/venv/bin/activate" ]; then
-  source "code/backend/venv/bin/activate"
-  echo "Python virtual environment activated."
-fi
+# The venv and the xdist probe are only needed by the Python suites
+if component_selected backend || component_selected quant_ml; then
+  # Assumes pytest is installed in the virtual environment
+  if [ -f "code/backend/venv/bin/activate" ]; then
+    source "code/backend/venv/bin/activate"
+    echo "Python virtual environment activated."
+  fi
 
-run_tests "Python Backend" "code/backend" "pytest"
+  # --- 1. Python Backend Tests (using pytest) ---
+  if component_selected backend; then
+    run_tests "Python Backend" "code/backend" pytest "${PYTEST_ARGS[@]}"
+  fi
+
+  # --- 1b. Quant ML Tests (using pytest, parallel when pytest-xdist is present) ---
+  # Test classes share fitted models via setUpClass, so --dist=loadscope keeps
+  # each class on one worker and fits every model once per worker.
+  if component_selected quant_ml; then
+    QUANT_ML_PYTEST=(python -m pytest tests "${PYTEST_ARGS[@]}")
+    if python -c "import xdist" &> /dev/null; then
+      QUANT_ML_PYTEST+=(-n auto --dist=loadscope)
+    fi
+    run_tests "Quant ML" "code/quant_ml" "${QUANT_ML_PYTEST[@]}"
+  fi
 
-if command -v deactivate &> /dev/null; then
-  deactivate
-  echo "Python virtual environment deactivated."
+  if command -v deactivate &> /dev/null; then
+    deactivate
+    echo "Python virtual environment deactivated."
+  fi
 fi
 
-# --- 2. Web Frontend Tests (using npm test) ---
-run_tests "Web Frontend" "web-frontend" "npm test"
+if component_selected frontend; then
+  # --- 2. Web Frontend Tests (using npm test) ---
+  run_tests "Web Frontend" "web-frontend" npm test
 
-# --- 3. Mobile Frontend Tests (using npm test) ---
-run_tests "Mobile Frontend" "mobile-frontend" "npm test"
+  # --- 3. Mobile Frontend Tests (using npm test) ---
+  run_tests "Mobile Frontend" "mobile-frontend" npm test
+fi
 
 # --- 4. Blockchain Tests (using truffle test or hardhat test) ---
-run_tests "Blockchain Contracts" "code/blockchain" "npm test"
+if component_selected blockchain; then
+  run_tests "Blockchain Contracts" "code/blockchain" npm test
+fi
+
+wait_for_tests
 
 echo "----------------------------------------"
 if [ "$TEST_EXIT_CODE" -eq 0 ]; then
@@ -117,12 +117,30 @@ source "$VENV_DIR/bin/activate"
 log "SUCCESS" "Virtual environment activated"
 
 # Install Python dependencies
-log "INFO" "Installing Python dependencies..."
-pip install --upgrade pip
-log "INFO" "Installing backend dependencies..."
-pip install -r "$PROJECT_ROOT/code/backend/requirements.txt"
-log "INFO" "Installing AI model dependencies..."
-pip install -r "$PROJECT_ROOT/code/ai_models/requirements.txt" 2>/dev/null || log "WARNING" "AI model requirements file not found, skipping"
+# Backend and AI model requirements go through one pip run, so the resolver
+# and index lookups happen once for both
+REQUIREMENTS_FILES=("$PROJECT_ROOT/code/backend/requirements.txt")
+if [ -f "$PROJECT_ROOT/code/ai_models/requirements.txt" ]; then
+    REQUIREMENTS_FILES+=("$PROJECT_ROOT/code/ai_models/requirements.txt")
+else
+    log "WARNING" "AI model requirements file not found, skipping"
+fi
+# The venv keeps a copy of the requirements it was last installed from; when
+# they are unchanged, the existing environment is reused without running pip
+REQUIREMENTS_STAMP="$VENV_DIR/.installed-requirements.txt"
+if [ -f "$REQUIREMENTS_STAMP" ] && cat "${REQUIREMENTS_FILES[@]}" | cmp -s - "$REQUIREMENTS_STAMP"; then
+    log "INFO" "Python dependencies are up to date, skipping install"
+else
+    log "INFO" "Installing Python dependencies..."
+    pip install --upgrade pip
+    REQUIREMENTS_ARGS=()
+    for requirements_file in "${REQUIREMENTS_FILES[@]}"; do
+        REQUIREMENTS_ARGS+=(-r "$requirements_file")
+    done
+    log "INFO" "Installing backend and AI model dependencies..."
+    pip install "${REQUIREMENTS_ARGS[@]}"
+    cat "${REQUIREMENTS_FILES[@]}" > "$REQUIREMENTS_STAMP"
+fi
 
 # Install Node.js dependencies
 log "INFO" "Installing Node.js dependencies..."